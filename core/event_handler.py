@@ -1,19 +1,78 @@
 import logging
 from collections import defaultdict
-from functools import partial, reduce
-from typing import DefaultDict
+from functools import partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import DefaultDict, Iterable, Sequence
 
+from django.conf import settings
 from django.core.cache import cache
-from django.db import IntegrityError
-from django.db.models import Q
-from django.db.transaction import atomic
+from django.db import IntegrityError, connection
+from django.db.models import BooleanField, Case, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.transaction import atomic, on_commit
 from django.utils import timezone
+from psycopg2.extras import execute_values
 
 from core import models, tasks
 from core.models import Dao
 
 logger = logging.getLogger("alerts")
 
+# shared, read-only defaults for missing Block sections. avoids allocating a new {} / [] per lookup
+_EMPTY_SECTION = MappingProxyType({})
+
+# field extractors for the hot event dicts. a single C-level call instead of one subscript per key
+_get_issued = itemgetter("asset_id", "owner", "total_supply")
+_get_transfer = itemgetter("asset_id", "amount", "from", "to")
+_get_delegation_revoked = itemgetter("asset_id", "delegated_by", "revoked_from")
+_get_vote_cast = itemgetter("proposal_id", "voter", "in_favor")
+_get_dao_owner = itemgetter("dao_id", "owner")
+_get_dao_new_owner = itemgetter("dao_id", "new_owner")
+_get_delegated = itemgetter("asset_id", "from", "to")
+_get_proposal_fault = itemgetter("proposal_id", "reason")
+_get_multisig_approving = itemgetter("call_hash", "multisig", "approving")
+_get_multisig_cancelling = itemgetter("call_hash", "multisig", "cancelling")
+
+
+def _events(block: models.Block, module: str, event: str) -> Sequence[dict]:
+    """
+    Args:
+        block: Block containing extrinsics and events
+        module: event module, e.g. "DaoCore"
+        event: event name, e.g. "DaoCreated"
+
+    Returns:
+        the Block's events for the given module and event name, empty if there are none
+    """
+    return block.event_data.get(module, _EMPTY_SECTION).get(event, ())
+
+
+def _extrinsics(block: models.Block, module: str, function: str) -> Sequence[dict]:
+    """
+    Args:
+        block: Block containing extrinsics and events
+        module: call module, e.g. "DaoCore"
+        function: call function, e.g. "create_dao"
+
+    Returns:
+        the Block's extrinsics for the given module and call function, empty if there are none
+    """
+    return block.extrinsic_data.get(module, _EMPTY_SECTION).get(function, ())
+
+
+def _rows_in(columns: Sequence[str], rows: Iterable[tuple]) -> RawSQL:
+    """
+    Args:
+        columns: db columns to match, e.g. ("asset_id", "owner_id")
+        rows: value tuples to match the columns against, e.g. [(1, "acc1"), (2, "acc2")]
+
+    Returns:
+        row value filter: WHERE (asset_id, owner_id) IN ((1, 'acc1'), (2, 'acc2'))
+        a single predicate instead of an N-way OR of ANDs, keeps query size and planning time linear
+    """
+    return RawSQL(f"({', '.join(columns)}) IN %s", (tuple(rows),), output_field=BooleanField())
+
 
 class ParseBlockException(Exception):
     pass
@@ -21,30 +80,31 @@ class ParseBlockException(Exception):
 
 class SubstrateEventHandler:
     block_actions: tuple = None
+    event_modules: frozenset = None
 
     def __init__(self):
+        # (action, event modules). all actions are event driven, Blocks w/o events of any of the modules are skipped
         self.block_actions = (
-            self._instantiate_contracts,
-            self._create_accounts,
-            self._create_daos,
-            self._transfer_dao_ownerships,
-            self._delete_daos,
-            self._create_assets,
-            self._transfer_assets,
-            self._delegate_assets,
-            self._revoke_asset_delegations,
-            self._set_dao_metadata,
-            self._dao_set_governances,
-            self._create_proposals,
-            self._set_proposal_metadata,
-            self._register_votes,
-            self._finalize_proposals,
-            self._fault_proposals,
-            self._handle_new_transactions,
-            self._approve_transactions,
-            self._execute_transactions,
-            self._cancel_transactions,
+            (self._instantiate_contracts, ("Contracts",)),
+            (self._create_accounts, ("System", "DaoCore")),
+            (self._process_dao_core, ("DaoCore",)),
+            (self._create_assets, ("Assets",)),
+            (self._transfer_assets, ("Assets",)),
+            (self._delegate_assets, ("Assets",)),
+            (self._revoke_asset_delegations, ("Assets",)),
+            (self._dao_set_governances, ("Votes",)),
+            (self._create_proposals, ("Votes",)),
+            (self._set_proposal_metadata, ("Votes",)),
+            (self._register_votes, ("Votes",)),
+            (self._finalize_proposals, ("Votes",)),
+            (self._fault_proposals, ("Votes",)),
+            (self._handle_new_transactions, ("Multisig",)),
+            (self._approve_transactions, ("Multisig",)),
+            (self._execute_transactions, ("Multisig",)),
+            (self._cancel_transactions, ("Multisig",)),
         )
+        # all event modules any action depends on
+        self.event_modules = frozenset(module for _, modules in self.block_actions for module in modules)
 
     @staticmethod
     def _instantiate_contracts(block: models.Block):
@@ -52,24 +112,23 @@ class SubstrateEventHandler:
         Args:
             block: Block containing extrinsics and events
         """
-        if ctr_event := block.event_data.get("Contracts", {}):
-            for event in ctr_event.get("ContractEmitted", []):
-                if event["name"] == 'Locked':
-                    account = event['args'][0]['value']
-                    token = event['args'][1]['value']
-                    holding = models.AssetHolding.objects.get(
-                        asset__dao__dao_contract_address=token, owner__address=account
-                    )
-                    holding.vesting_wallet = event['contract']
-                    holding.save()
-                elif event["name"] == 'VestingWalletCreated':
-                    account = event['args'][0]['value']
-                    token = event['args'][1]['value']
-                    holding = models.AssetHolding.objects.get(
-                        asset__dao__dao_contract_address=token, owner__address=account
-                    )
-                    holding.vote_escrow = event['contract']
-                    holding.save()
+        for event in _events(block, "Contracts", "ContractEmitted"):
+            if event["name"] == 'Locked':
+                account = event['args'][0]['value']
+                token = event['args'][1]['value']
+                holding = models.AssetHolding.objects.get(
+                    asset__dao__dao_contract_address=token, owner__address=account
+                )
+                holding.vesting_wallet = event['contract']
+                holding.save()
+            elif event["name"] == 'VestingWalletCreated':
+                account = event['args'][0]['value']
+                token = event['args'][1]['value']
+                holding = models.AssetHolding.objects.get(
+                    asset__dao__dao_contract_address=token, owner__address=account
+                )
+                holding.vote_escrow = event['contract']
+                holding.save()
 
 
     @staticmethod
@@ -78,13 +137,30 @@ class SubstrateEventHandler:
         Args:
             block: Block containing extrinsics and events
 
-        creates Accounts based on the Block's extrinsics and events
+        creates Accounts based on the Block's extrinsics and events.
+        this includes new Dao owners, needed for multi signature wallets.
+        """
+        if addresses := {
+            *(account_event["account"] for account_event in _events(block, "System", "NewAccount")),
+            *(dao_event["new_owner"] for dao_event in _events(block, "DaoCore", "DaoOwnerChanged")),
+        }:
+            models.Account.objects.bulk_create(
+                [models.Account(address=address) for address in addresses],
+                ignore_conflicts=True,
+                batch_size=settings.BULK_BATCH_SIZE,
+            )
+
+    def _process_dao_core(self, block: models.Block):
+        """
+        Args:
+            block: Block containing extrinsics and events
+
+        runs all DaoCore driven actions
         """
-        if accs := [
-            models.Account(address=dao_event["account"])
-            for dao_event in block.event_data.get("System", {}).get("NewAccount", [])
-        ]:
-            models.Account.objects.bulk_create(accs, ignore_conflicts=True)
+        self._create_daos(block=block)
+        self._transfer_dao_ownerships(block=block)
+        self._delete_daos(block=block)
+        self._set_dao_metadata(block=block)
 
     @staticmethod
     def _create_daos(block: models.Block):
@@ -94,21 +170,25 @@ class SubstrateEventHandler:
 
         creates Daos based on the Block's extrinsics and events
         """
+        if not (dao_events := _events(block, "DaoCore", "DaoCreated")) or not (
+            dao_extrinsics := _extrinsics(block, "DaoCore", "create_dao")
+        ):
+            return
+
+        owner_by_dao_id = dict(map(_get_dao_owner, dao_events))  # {dao_id: owner_id}
         daos = []
-        for dao_extrinsic in block.extrinsic_data.get("DaoCore", {}).get("create_dao", []):
-            for dao_event in block.event_data.get("DaoCore", {}).get("DaoCreated", []):
-                if dao_extrinsic["dao_id"] == dao_event["dao_id"]:
-                    daos.append(
-                        models.Dao(
-                            id=dao_extrinsic["dao_id"],
-                            name=dao_extrinsic["dao_name"],
-                            creator_id=dao_event["owner"],
-                            owner_id=dao_event["owner"],
-                        )
+        for dao_extrinsic in dao_extrinsics:
+            if (owner_id := owner_by_dao_id.get(dao_extrinsic["dao_id"])) is not None:
+                daos.append(
+                    models.Dao(
+                        id=dao_extrinsic["dao_id"],
+                        name=dao_extrinsic["dao_name"],
+                        creator_id=owner_id,
+                        owner_id=owner_id,
                     )
-                    break
+                )
         if daos:
-            models.Dao.objects.bulk_create(daos)
+            models.Dao.objects.bulk_create(daos, batch_size=settings.BULK_BATCH_SIZE)
 
     @staticmethod
     def _transfer_dao_ownerships(block: models.Block):
@@ -118,27 +198,39 @@ class SubstrateEventHandler:
 
         transfers ownerships of a Daos to new Accounts based on the Block's events
         """
-        dao_id_to_new_owner_id = {}  # {dao_id: new_owner_id}
-        for dao_event in block.event_data.get("DaoCore", {}).get("DaoOwnerChanged", []):
-            dao_id_to_new_owner_id[dao_event["dao_id"]] = dao_event["new_owner"]
-
-        for dao in (daos := list(models.Dao.objects.filter(id__in=dao_id_to_new_owner_id.keys()))):
-            dao.owner_id = dao_id_to_new_owner_id[dao.id]
-            dao.setup_complete = True
+        if not (dao_events := _events(block, "DaoCore", "DaoOwnerChanged")):
+            return
+
+        dao_id_to_new_owner_id = dict(map(_get_dao_new_owner, dao_events))  # {dao_id: new_owner_id}
+
+        # UPDATE core_dao SET owner_id = v.owner_id, setup_complete = true
+        # FROM (VALUES ('dao1', 'acc1'), ...) AS v(id, owner_id) WHERE core_dao.id = v.id RETURNING core_dao.id
+        # Accounts of the new owners have already been created in _create_accounts
+        table = models.Dao._meta.db_table
+        with connection.cursor() as cursor:
+            updated_dao_ids = execute_values(
+                cursor,
+                f"""
+                UPDATE {table} SET owner_id = v.owner_id, setup_complete = true
+                FROM (VALUES %s) AS v(id, owner_id)
+                WHERE {table}.id = v.id
+                RETURNING {table}.id
+                """,
+                list(dao_id_to_new_owner_id.items()),
+                page_size=settings.BULK_BATCH_SIZE,
+                fetch=True,
+            )
 
-        if daos:
-            # try creating Accounts, needed for multi signature wallets
-            models.Account.objects.bulk_create(
-                [models.Account(address=address) for address in dao_id_to_new_owner_id.values()],
-                ignore_conflicts=True,
+        # update MultiSig accs
+        if updated_dao_ids and (
+            multisigs := models.MultiSig.objects.filter(
+                address__in={dao_id_to_new_owner_id[dao_id] for dao_id, in updated_dao_ids}
             )
-            models.Dao.objects.bulk_update(daos, ["owner_id", "setup_complete"])
-            # update MultiSig accs
-            if multisigs := models.MultiSig.objects.filter(address__in=dao_id_to_new_owner_id.values()):
-                owner_id_to_dao_id = {v: k for k, v in dao_id_to_new_owner_id.items()}
-                for multisig in multisigs:
-                    multisig.dao_id = owner_id_to_dao_id[multisig.address]
-                models.MultiSig.objects.bulk_update(multisigs, ["dao_id"])
+        ):
+            owner_id_to_dao_id = {v: k for k, v in dao_id_to_new_owner_id.items()}
+            for multisig in multisigs:
+                multisig.dao_id = owner_id_to_dao_id[multisig.address]
+            models.MultiSig.objects.bulk_update(multisigs, ["dao_id"], batch_size=settings.BULK_BATCH_SIZE)
 
     @staticmethod
     def _delete_daos(block: models.Block):
@@ -148,9 +240,7 @@ class SubstrateEventHandler:
 
         deletes Daos based on the Block's extrinsics and events
         """
-        if dao_ids := [
-            dao_event["dao_id"] for dao_event in block.event_data.get("DaoCore", {}).get("DaoDestroyed", [])
-        ]:
+        if dao_ids := [dao_event["dao_id"] for dao_event in _events(block, "DaoCore", "DaoDestroyed")]:
             models.Dao.objects.filter(id__in=dao_ids).delete()
 
     @staticmethod
@@ -161,37 +251,39 @@ class SubstrateEventHandler:
 
         creates Assets based on the Block's extrinsics and events
         """
+        if not (asset_issued_events := _events(block, "Assets", "Issued")) or not (
+            asset_metadata_events := _events(block, "Assets", "MetadataSet")
+        ):
+            return
 
         # create Assets and assign to Daos
+        asset_metadata_by_id = {  # {asset_id: asset_metadata}
+            asset_metadata["asset_id"]: asset_metadata for asset_metadata in asset_metadata_events
+        }
         assets = []
         asset_holdings = []
-        for asset_issued_event in block.event_data.get("Assets", {}).get("Issued", []):
-            for asset_metadata in block.event_data.get("Assets", {}).get("MetadataSet", []):
-                if asset_issued_event["asset_id"] == asset_metadata["asset_id"]:
-                    asset_id, owner_id, balance = (
-                        asset_metadata["asset_id"],
-                        asset_issued_event["owner"],
-                        asset_issued_event["total_supply"],
+        for asset_issued_event in asset_issued_events:
+            asset_id, owner_id, balance = _get_issued(asset_issued_event)
+            if asset_metadata := asset_metadata_by_id.get(asset_id):
+                assets.append(
+                    models.Asset(
+                        id=asset_id,
+                        # a Dao's token is issued with the Dao's id as its symbol, so symbol == dao_id
+                        dao_id=asset_metadata["symbol"],
+                        owner_id=owner_id,
+                        total_supply=balance,
                     )
-                    assets.append(
-                        models.Asset(
-                            id=asset_id,
-                            dao_id=asset_metadata["symbol"],
-                            owner_id=owner_id,
-                            total_supply=balance,
-                        )
-                    )
-                    asset_holdings.append(
-                        models.AssetHolding(
-                            asset_id=asset_id,
-                            owner_id=owner_id,
-                            balance=balance,
-                        )
+                )
+                asset_holdings.append(
+                    models.AssetHolding(
+                        asset_id=asset_id,
+                        owner_id=owner_id,
+                        balance=balance,
                     )
+                )
         if assets:
-            for asset_holding_obj, asset in zip(asset_holdings, models.Asset.objects.bulk_create(assets)):
-                asset_holding_obj.asset_id = asset.id
-            models.AssetHolding.objects.bulk_create(asset_holdings)
+            models.Asset.objects.bulk_create(assets, batch_size=settings.BULK_BATCH_SIZE)
+            models.AssetHolding.objects.bulk_create(asset_holdings, batch_size=settings.BULK_BATCH_SIZE)
 
     @staticmethod
     def _transfer_assets(block: models.Block):
@@ -202,53 +294,42 @@ class SubstrateEventHandler:
         transfers Assets based on the Block's extrinsics and events
         rephrase: transfers ownership of an amount of tokens (models.AssetHolding) from one Account to another
         """
-        asset_holding_data = []  # [(asset_id, amount, from_acc, to_acc), ...]
-        asset_ids_to_owner_ids = defaultdict(set)  # {1 (asset_id): {1, 2, 3} (owner_ids)...}
-        for asset_issued_event in block.event_data.get("Assets", {}).get("Transferred", []):
-            asset_id, amount = asset_issued_event["asset_id"], asset_issued_event["amount"]
-            from_acc, to_acc = asset_issued_event["from"], asset_issued_event["to"]
-            asset_holding_data.append((asset_id, amount, from_acc, to_acc))
-            asset_ids_to_owner_ids[asset_id].add(from_acc)
-            asset_ids_to_owner_ids[asset_id].add(to_acc)
-
-        if asset_holding_data:
-            existing_holdings = defaultdict(dict)
-            for asset_holding in models.AssetHolding.objects.filter(
-                # WHERE (
-                #     (asset_holding.asset_id = 1 AND asset_holding.owner_id IN (1, 2))
-                #     OR (asset_holding.asset_id = 2 AND asset_holding.owner_id IN (3, 4))
-                #     OR ...
-                # )
-                reduce(
-                    Q.__or__,
-                    [
-                        Q(asset_id=asset_id, owner_id__in=owner_ids)
-                        for asset_id, owner_ids in asset_ids_to_owner_ids.items()
-                    ],
+        if not (transfer_events := _events(block, "Assets", "Transferred")):
+            return
+
+        balance_deltas: DefaultDict = defaultdict(int)  # {(asset_id, owner_id): balance_delta}
+        for transfer_event in transfer_events:
+            asset_id, amount, from_acc, to_acc = _get_transfer(transfer_event)
+            balance_deltas[(asset_id, from_acc)] -= amount
+            balance_deltas[(asset_id, to_acc)] += amount
+
+        # add the deltas to the existing models.AssetHoldings or create new ones with balance = delta.
+        # balance is stored as varchar (utils.BiggerIntField), hence the numeric casts.
+        # newly inserted rows (xmax = 0) w/ a negative balance are senders without an existing models.AssetHolding
+        table = models.AssetHolding._meta.db_table
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            missing_holdings = execute_values(
+                cursor,
+                f"""
+                WITH upserted AS (
+                    INSERT INTO {table} (asset_id, owner_id, balance, created_at, updated_at)
+                    VALUES %s
+                    ON CONFLICT (asset_id, owner_id) DO UPDATE
+                    SET balance = ({table}.balance::numeric + EXCLUDED.balance::numeric)::text
+                    RETURNING asset_id, owner_id, balance, xmax = 0 AS inserted
                 )
-            ):
-                existing_holdings[asset_holding.asset_id][asset_holding.owner_id] = asset_holding
-
-            asset_holdings_to_create = {}
-            for asset_id, amount, from_acc, to_acc in asset_holding_data:
-                # subtract transferred amount from existing models.AssetHolding
-                existing_holdings[asset_id][from_acc].balance -= amount
-
-                #  add transferred amount if models.AssetHolding already exists
-                if to_acc_holding := asset_holdings_to_create.get((asset_id, to_acc)):
-                    to_acc_holding.balance += amount
-                elif to_acc_holding := existing_holdings.get(asset_id, {}).get(to_acc):
-                    to_acc_holding.balance += amount
-                # otherwise create a new models.AssetHolding with balance = transferred amount
-                else:
-                    asset_holdings_to_create[(asset_id, to_acc)] = models.AssetHolding(
-                        owner_id=to_acc, asset_id=asset_id, balance=amount
-                    )
-            models.AssetHolding.objects.bulk_update(
-                [holding for acc_to_holding in existing_holdings.values() for holding in acc_to_holding.values()],
-                ["balance"],
+                SELECT asset_id, owner_id FROM upserted WHERE inserted AND balance::numeric < 0
+                """,
+                [
+                    (asset_id, owner_id, str(balance_delta), now, now)
+                    for (asset_id, owner_id), balance_delta in balance_deltas.items()
+                ],
+                page_size=settings.BULK_BATCH_SIZE,
+                fetch=True,
             )
-            models.AssetHolding.objects.bulk_create(asset_holdings_to_create.values())
+        if missing_holdings:
+            raise ParseBlockException(f"Transfers from Accounts without AssetHolding: {missing_holdings}.")
 
     @staticmethod
     def _delegate_assets(block: models.Block):
@@ -259,27 +340,23 @@ class SubstrateEventHandler:
         delegates votes to another account based on the Block's extrinsics and events
         """
         if data := {
-            (event["asset_id"], event["from"]): event["to"]
-            for event in block.event_data.get("Assets", {}).get("Delegated", [])
+            (asset_id, owner_id): delegated_to_id
+            for asset_id, owner_id, delegated_to_id in map(_get_delegated, _events(block, "Assets", "Delegated"))
         }:
-            for asset_holding in (
-                asset_holdings := list(
-                    models.AssetHolding.objects.filter(
-                        # WHERE (
-                        #     (asset_holding.asset_id = 1 AND asset_holding.owner_id = 2)
-                        #     OR (asset_holding.asset_id =3 AND asset_holding.owner_id = 4)
-                        #     OR ...
-                        # )
-                        reduce(
-                            Q.__or__,
-                            [Q(asset_id=asset_id, owner_id=owner_id) for asset_id, owner_id in data.keys()],
-                        )
-                    )
+            holding_keys_by_delegate = defaultdict(list)  # {delegated_to_id: [(asset_id, owner_id), ...]}
+            for holding_key, delegated_to_id in data.items():
+                holding_keys_by_delegate[delegated_to_id].append(holding_key)
+            # UPDATE asset_holding SET delegated_to_id = CASE
+            #     WHEN (asset_id, owner_id) IN ((1, 'acc1'), ...) THEN 'acc2' ... END
+            # WHERE (asset_id, owner_id) IN ((1, 'acc1'), (2, 'acc3'), ...)
+            models.AssetHolding.objects.filter(_rows_in(("asset_id", "owner_id"), data.keys())).update(
+                delegated_to_id=Case(
+                    *[
+                        When(_rows_in(("asset_id", "owner_id"), holding_keys), then=Value(delegated_to_id))
+                        for delegated_to_id, holding_keys in holding_keys_by_delegate.items()
+                    ]
                 )
-            ):
-                asset_holding.delegated_to_id = data[(asset_holding.asset_id, asset_holding.owner_id)]
-
-            models.AssetHolding.objects.bulk_update(asset_holdings, ["delegated_to_id"])
+            )
 
     @staticmethod
     def _revoke_asset_delegations(block: models.Block):
@@ -290,23 +367,10 @@ class SubstrateEventHandler:
         revokes delegation of votes to another account based on the Block's extrinsics and events
         """
 
-        if data := [
-            (event["asset_id"], event["delegated_by"], event["revoked_from"])
-            for event in block.event_data.get("Assets", {}).get("DelegationRevoked", [])
-        ]:
+        if data := [_get_delegation_revoked(event) for event in _events(block, "Assets", "DelegationRevoked")]:
             models.AssetHolding.objects.filter(
-                # WHERE (
-                #     (holding.asset_id = 1 AND holding.owner_id = 2 AND holding.delegated_to_id = 3)
-                #     OR (holding.asset_id = 4 AND holding.owner_id = 5 AND holding.delegated_to_id = 6)
-                #     OR ...
-                # )
-                reduce(
-                    Q.__or__,
-                    [
-                        Q(asset_id=asset_id, owner_id=owner_id, delegated_to_id=delegated_to_id)
-                        for asset_id, owner_id, delegated_to_id in data
-                    ],
-                )
+                # WHERE (asset_id, owner_id, delegated_to_id) IN ((1, 'acc1', 'acc2'), (2, 'acc3', 'acc4'), ...)
+                _rows_in(("asset_id", "owner_id", "delegated_to_id"), data)
             ).update(delegated_to_id=None)
 
     @staticmethod
@@ -317,16 +381,22 @@ class SubstrateEventHandler:
 
         updates Daos' metadata_url and metadata_hash based on the Block's extrinsics and events
         """
+        if not (dao_events := _events(block, "DaoCore", "DaoMetadataSet")) or not (
+            dao_extrinsics := _extrinsics(block, "DaoCore", "set_metadata")
+        ):
+            return
+
+        dao_extrinsic_by_dao_id = {dao_extrinsic["dao_id"]: dao_extrinsic for dao_extrinsic in dao_extrinsics}
         dao_metadata = {}  # {dao_id: {"metadata_url": metadata_url, "metadata_hash": metadata_hash}}
-        for dao_event in block.event_data.get("DaoCore", {}).get("DaoMetadataSet", []):
-            for dao_extrinsic in block.extrinsic_data.get("DaoCore", {}).get("set_metadata", []):
-                if (dao_id := dao_event["dao_id"]) == dao_extrinsic["dao_id"]:
-                    dao_metadata[dao_id] = {
-                        "metadata_url": dao_extrinsic["meta"],
-                        "metadata_hash": dao_extrinsic["hash"],
-                    }
+        for dao_event in dao_events:
+            if dao_extrinsic := dao_extrinsic_by_dao_id.get(dao_id := dao_event["dao_id"]):
+                dao_metadata[dao_id] = {
+                    "metadata_url": dao_extrinsic["meta"],
+                    "metadata_hash": dao_extrinsic["hash"],
+                }
         if dao_metadata:
-            tasks.update_dao_metadata.delay(dao_metadata=dao_metadata)
+            # only dispatch once the Block is committed, rolled back Blocks mustn't trigger any downloads
+            on_commit(partial(tasks.update_dao_metadata.delay, dao_metadata=dao_metadata))
 
     @staticmethod
     def _dao_set_governances(block: models.Block):
@@ -336,23 +406,27 @@ class SubstrateEventHandler:
 
         updates Daos' governance based on the Block's extrinsics and events
         """
-        governances = []
-        dao_ids = set()
-        for governance_event in block.event_data.get("Votes", {}).get("SetGovernanceMajorityVote", []):
-            dao_ids.add(governance_event["dao_id"])
-            governances.append(
-                models.Governance(
-                    dao_id=governance_event["dao_id"],
-                    proposal_duration=governance_event["proposal_duration"],
-                    proposal_token_deposit=governance_event["proposal_token_deposit"],
-                    minimum_majority=governance_event["minimum_majority_per_1024"],
-                    type=models.GovernanceType.MAJORITY_VOTE,
-                )
-            )
+        if not (governance_events := _events(block, "Votes", "SetGovernanceMajorityVote")):
+            return
 
-        if governances:
-            models.Governance.objects.filter(dao_id__in=dao_ids).delete()
-            models.Governance.objects.bulk_create(governances)
+        governances = {  # {dao_id: Governance}, the last event per Dao wins
+            governance_event["dao_id"]: models.Governance(
+                dao_id=governance_event["dao_id"],
+                proposal_duration=governance_event["proposal_duration"],
+                proposal_token_deposit=governance_event["proposal_token_deposit"],
+                minimum_majority=governance_event["minimum_majority_per_1024"],
+                type=models.GovernanceType.MAJORITY_VOTE,
+            )
+            for governance_event in governance_events
+        }
+        # INSERT ... ON CONFLICT (dao_id) DO UPDATE, replaces the Daos' current Governance in place
+        models.Governance.objects.bulk_create(
+            governances.values(),
+            update_conflicts=True,
+            unique_fields=["dao"],
+            update_fields=["type", "proposal_duration", "proposal_token_deposit", "minimum_majority", "updated_at"],
+            batch_size=settings.BULK_BATCH_SIZE,
+        )
 
     @staticmethod
     def _create_proposals(block: models.Block):
@@ -362,36 +436,44 @@ class SubstrateEventHandler:
 
         create Proposals based on the Block's extrinsics and events
         """
-        proposals = []
-        dao_ids = set()
-
-        for proposal_created_event in block.event_data.get("Votes", {}).get("ProposalCreated", []):
-            dao_id = proposal_created_event["dao_id"]
-            dao_ids.add(dao_id)
-            proposals.append(
-                models.Proposal(
-                    id=proposal_created_event["proposal_id"],
-                    dao_id=dao_id,
-                    creator_id=proposal_created_event["creator"],
-                    birth_block_number=block.number,
-                )
+        if not (proposal_created_events := _events(block, "Votes", "ProposalCreated")):
+            return
+
+        proposals = [
+            models.Proposal(
+                id=proposal_created_event["proposal_id"],
+                dao_id=proposal_created_event["dao_id"],
+                creator_id=proposal_created_event["creator"],
+                birth_block_number=block.number,
             )
-        if proposals:
-            dao_id_to_voter_id_to_balance: DefaultDict = defaultdict(partial(defaultdict, int))
-            for dao_id, owner_id, delegated_to_id, balance in models.AssetHolding.objects.filter(
-                asset__dao__id__in=dao_ids
-            ).values_list("asset__dao_id", "owner_id", "delegated_to_id", "balance"):
-                dao_id_to_voter_id_to_balance[dao_id][delegated_to_id or owner_id] += balance
-
-            models.Proposal.objects.bulk_create(proposals)
-            # for all proposals: create a Vote placeholder for each Account holding tokens (AssetHoldings) of the
-            # corresponding Dao to keep track of the Account's voting power at the time of Proposal creation.
-            models.Vote.objects.bulk_create(
-                [
-                    models.Vote(proposal_id=proposal.id, voter_id=voter_id, voting_power=balance)
-                    for proposal in proposals
-                    for voter_id, balance in dao_id_to_voter_id_to_balance[proposal.dao_id].items()
-                ]
+            for proposal_created_event in proposal_created_events
+        ]
+        models.Proposal.objects.bulk_create(proposals, batch_size=settings.BULK_BATCH_SIZE)
+
+        # for all proposals: create a Vote placeholder for each Account holding tokens (AssetHoldings) of the
+        # corresponding Dao to keep track of the Account's voting power at the time of Proposal creation.
+        # this has to happen within the Block's transaction: the placeholders snapshot the balances of this Block
+        # and _register_votes only updates existing Votes, so deferring them would lose votes cast shortly after.
+        # the voting power is aggregated and inserted entirely in the db, no AssetHolding or Vote leaves it.
+        # balance is stored as varchar (utils.BiggerIntField), hence the numeric casts.
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {models.Vote._meta.db_table} (proposal_id, voter_id, voting_power, created_at, updated_at)
+                SELECT
+                    proposal.id,
+                    COALESCE(holding.delegated_to_id, holding.owner_id),
+                    SUM(holding.balance::numeric)::text,
+                    %s,
+                    %s
+                FROM {models.Proposal._meta.db_table} proposal
+                JOIN {models.Asset._meta.db_table} asset ON asset.dao_id = proposal.dao_id
+                JOIN {models.AssetHolding._meta.db_table} holding ON holding.asset_id = asset.id
+                WHERE proposal.id IN %s
+                GROUP BY 1, 2
+                """,
+                (now, now, tuple(proposal.id for proposal in proposals)),
             )
 
     @staticmethod
@@ -402,20 +484,28 @@ class SubstrateEventHandler:
 
         set Proposals' metadata based on the Block's extrinsics and events
         """
+        if not (proposal_events := _events(block, "Votes", "ProposalMetadataSet")) or not (
+            proposal_extrinsics := _extrinsics(block, "Votes", "set_metadata")
+        ):
+            return
+
+        extrinsic_by_proposal_id = {  # {proposal_id: proposal_extrinsic}
+            proposal_extrinsic["proposal_id"]: proposal_extrinsic for proposal_extrinsic in proposal_extrinsics
+        }
         proposal_data = {}  # proposal_id: (metadata_hash, metadata_url)
-        for proposal_created_event in block.event_data.get("Votes", {}).get("ProposalMetadataSet", []):
-            for proposal_created_extrinsic in block.extrinsic_data.get("Votes", {}).get("set_metadata", []):
-                if (proposal_id := proposal_created_extrinsic["proposal_id"]) == proposal_created_event["proposal_id"]:
-                    proposal_data[proposal_id] = (
-                        proposal_created_extrinsic["hash"],
-                        proposal_created_extrinsic["meta"],
-                    )
+        for proposal_event in proposal_events:
+            if proposal_extrinsic := extrinsic_by_proposal_id.get(proposal_id := proposal_event["proposal_id"]):
+                proposal_data[proposal_id] = (proposal_extrinsic["hash"], proposal_extrinsic["meta"])
         if proposal_data:
             for proposal in (proposals := models.Proposal.objects.filter(id__in=proposal_data.keys())):
                 proposal.metadata_hash, proposal.metadata_url = proposal_data[proposal.id]
                 proposal.setup_complete = True
-            models.Proposal.objects.bulk_update(proposals, fields=["metadata_hash", "metadata_url", "setup_complete"])
-            tasks.update_proposal_metadata.delay(proposal_ids=list(proposal_data.keys()))
+            models.Proposal.objects.bulk_update(
+                proposals,
+                fields=["metadata_hash", "metadata_url", "setup_complete"],
+                batch_size=settings.BULK_BATCH_SIZE,
+            )
+            on_commit(partial(tasks.update_proposal_metadata.delay, proposal_ids=list(proposal_data.keys())))
 
     @staticmethod
     def _register_votes(block: models.Block):
@@ -425,28 +515,25 @@ class SubstrateEventHandler:
 
         registers Votes based on the Block's events
         """
-        proposal_ids_to_voting_data = defaultdict(dict)  # {proposal_id: {voter_id: in_favor}}
-        for voting_event in block.event_data.get("Votes", {}).get("VoteCast", []):
-            proposal_ids_to_voting_data[voting_event["proposal_id"]][voting_event["voter"]] = voting_event["in_favor"]
-        if proposal_ids_to_voting_data:
-            for vote in (
-                votes_to_update := models.Vote.objects.filter(
-                    # WHERE (
-                    #     (vote.proposal_id = 1 AND vote.voter_id IN (1, 2))
-                    #     OR (vote.proposal_id = 2 AND vote.voter_id IN (3, 4))
-                    #     OR ...
-                    # )
-                    reduce(
-                        Q.__or__,
-                        [
-                            Q(proposal_id=proposal_id, voter_id__in=voting_data.keys())
-                            for proposal_id, voting_data in proposal_ids_to_voting_data.items()
-                        ],
-                    )
+        if voting_data := {  # {(proposal_id, voter_id): in_favor}
+            (proposal_id, voter_id): in_favor
+            for proposal_id, voter_id, in_favor in map(_get_vote_cast, _events(block, "Votes", "VoteCast"))
+        }:
+            # UPDATE core_vote SET in_favor = v.in_favor
+            # FROM (VALUES (1, 'acc1', true), ...) AS v(proposal_id, voter_id, in_favor)
+            # WHERE core_vote.proposal_id = v.proposal_id AND core_vote.voter_id = v.voter_id
+            table = models.Vote._meta.db_table
+            with connection.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    f"""
+                    UPDATE {table} SET in_favor = v.in_favor
+                    FROM (VALUES %s) AS v(proposal_id, voter_id, in_favor)
+                    WHERE {table}.proposal_id = v.proposal_id AND {table}.voter_id = v.voter_id
+                    """,
+                    [(proposal_id, voter_id, in_favor) for (proposal_id, voter_id), in_favor in voting_data.items()],
+                    page_size=settings.BULK_BATCH_SIZE,
                 )
-            ):
-                vote.in_favor = proposal_ids_to_voting_data[vote.proposal_id][vote.voter_id]
-            models.Vote.objects.bulk_update(votes_to_update, ["in_favor"])
 
     @staticmethod
     def _finalize_proposals(block: models.Block):
@@ -456,10 +543,9 @@ class SubstrateEventHandler:
 
         finalizes Proposals based on the Block's events
         """
-        votes_events = block.event_data.get("Votes", {})
-        if accepted_proposal_ids := set(prop["proposal_id"] for prop in votes_events.get("ProposalAccepted", [])):
+        if accepted_proposal_ids := set(prop["proposal_id"] for prop in _events(block, "Votes", "ProposalAccepted")):
             models.Proposal.objects.filter(id__in=accepted_proposal_ids).update(status=models.ProposalStatus.PENDING)
-        if rejected_proposal_ids := set(prop["proposal_id"] for prop in votes_events.get("ProposalRejected", [])):
+        if rejected_proposal_ids := set(prop["proposal_id"] for prop in _events(block, "Votes", "ProposalRejected")):
             models.Proposal.objects.filter(id__in=rejected_proposal_ids).update(status=models.ProposalStatus.REJECTED)
 
     @staticmethod
@@ -470,14 +556,21 @@ class SubstrateEventHandler:
 
         faults Proposals based on the Block's events
         """
-        if faulted_proposals := {
-            fault_event["proposal_id"]: fault_event["reason"]
-            for fault_event in block.event_data.get("Votes", {}).get("ProposalFaulted", [])
-        }:
-            for proposal in (proposals := models.Proposal.objects.filter(id__in=faulted_proposals.keys())):
-                proposal.fault = faulted_proposals[proposal.id]
-                proposal.status = models.ProposalStatus.FAULTED
-            models.Proposal.objects.bulk_update(proposals, ("fault", "status"))
+        if faulted_proposals := dict(map(_get_proposal_fault, _events(block, "Votes", "ProposalFaulted"))):
+            proposal_ids_by_reason = defaultdict(list)  # {reason: [proposal_id, ...]}
+            for proposal_id, reason in faulted_proposals.items():
+                proposal_ids_by_reason[reason].append(proposal_id)
+            # UPDATE proposal SET status = 'faulted', fault = CASE WHEN id IN (1, 2) THEN 'reason 1' ... END
+            # WHERE id IN (1, 2, ...)
+            models.Proposal.objects.filter(id__in=faulted_proposals.keys()).update(
+                status=models.ProposalStatus.FAULTED,
+                fault=Case(
+                    *[
+                        When(id__in=proposal_ids, then=Value(reason))
+                        for reason, proposal_ids in proposal_ids_by_reason.items()
+                    ]
+                ),
+            )
 
     @staticmethod
     def _handle_new_transactions(block: models.Block):
@@ -489,42 +582,41 @@ class SubstrateEventHandler:
         """
         # update existing Transactions
         if transaction_data := {
-            (multisig_event["call_hash"], multisig_event["multisig"]): multisig_event["approving"]
-            for multisig_event in block.event_data.get("Multisig", {}).get("NewMultisig", [])
+            (call_hash, multisig): approving
+            for call_hash, multisig, approving in map(
+                _get_multisig_approving, _events(block, "Multisig", "NewMultisig")
+            )
         }:
             for transaction in (
                 transactions_to_update := models.MultiSigTransaction.objects.filter(
-                    # WHERE (
-                    #     (call_hash = 1 AND multisig_id 2)
-                    #     OR (call_hash = 3 AND multisig_id 4)
-                    #     OR ...
-                    #     AND executed_at is null
-                    # )
-                    reduce(
-                        Q.__or__,
-                        [
-                            Q(call_hash=call_hash, multisig_id=multisig)
-                            for (call_hash, multisig) in transaction_data.keys()
-                        ],
-                    ),
+                    # WHERE (call_hash, multisig_id) IN (('h1', 'acc1'), ('h2', 'acc2'), ...) AND executed_at IS NULL
+                    _rows_in(("call_hash", "multisig_id"), transaction_data.keys()),
                     executed_at__isnull=True,
                 )
             ):
                 transaction.approvers.append(transaction_data.pop((transaction.call_hash, transaction.multisig_id)))
             if transactions_to_update:
-                models.MultiSigTransaction.objects.bulk_update(transactions_to_update, ("approvers",))
+                models.MultiSigTransaction.objects.bulk_update(
+                    transactions_to_update,
+                    ("approvers",),
+                    batch_size=settings.BULK_BATCH_SIZE,
+                )
 
         # create new Transactions
         if transaction_data:
-            multisigs_to_create = []
+            multisigs_to_create = {}  # {multisig: MultiSig}, a MultiSig may have several new Transactions per Block
             transactions_to_create = []
             for (call_hash, multisig), approver in transaction_data.items():
-                multisigs_to_create.append(models.MultiSig(account_ptr_id=multisig))
+                multisigs_to_create[multisig] = models.MultiSig(account_ptr_id=multisig)
                 transactions_to_create.append(
                     models.MultiSigTransaction(multisig_id=multisig, call_hash=call_hash, approvers=[approver])
                 )
-            models.MultiSig.objects.bulk_create(multisigs_to_create, ignore_conflicts=True)
-            models.MultiSigTransaction.objects.bulk_create(transactions_to_create)
+            models.MultiSig.objects.bulk_create(
+                multisigs_to_create.values(),
+                ignore_conflicts=True,
+                batch_size=settings.BULK_BATCH_SIZE,
+            )
+            models.MultiSigTransaction.objects.bulk_create(transactions_to_create, batch_size=settings.BULK_BATCH_SIZE)
 
     @staticmethod
     def _approve_transactions(block: models.Block):
@@ -535,33 +627,26 @@ class SubstrateEventHandler:
         approves Transactions based on the Block's events
         """
         data_by_call_hash: defaultdict = defaultdict(list)
-        for multisig_event in block.event_data.get("Multisig", {}).get("MultisigApproval", []):
-            data_by_call_hash[(multisig_event["call_hash"], multisig_event["multisig"])].append(
-                multisig_event["approving"]
-            )
+        for call_hash, multisig, approving in map(
+            _get_multisig_approving, _events(block, "Multisig", "MultisigApproval")
+        ):
+            data_by_call_hash[(call_hash, multisig)].append(approving)
 
         if data_by_call_hash:
             for transaction in (
                 transaction_to_update := models.MultiSigTransaction.objects.filter(
-                    # WHERE (
-                    #     (call_hash = 1 AND multisig_id 2)
-                    #     OR (call_hash = 3 AND multisig_id 4)
-                    #     OR ...
-                    #     AND executed_at is null
-                    # )
-                    reduce(
-                        Q.__or__,
-                        [
-                            Q(call_hash=call_hash, multisig_id=multisig)
-                            for (call_hash, multisig) in data_by_call_hash.keys()
-                        ],
-                    ),
+                    # WHERE (call_hash, multisig_id) IN (('h1', 'acc1'), ('h2', 'acc2'), ...) AND executed_at IS NULL
+                    _rows_in(("call_hash", "multisig_id"), data_by_call_hash.keys()),
                     executed_at__isnull=True,
                 )
             ):
                 transaction.approvers.extend(data_by_call_hash[(transaction.call_hash, transaction.multisig_id)])
             if transaction_to_update:
-                models.MultiSigTransaction.objects.bulk_update(transaction_to_update, ("approvers",))
+                models.MultiSigTransaction.objects.bulk_update(
+                    transaction_to_update,
+                    ("approvers",),
+                    batch_size=settings.BULK_BATCH_SIZE,
+                )
 
     @staticmethod
     def _execute_transactions(block: models.Block):
@@ -574,11 +659,13 @@ class SubstrateEventHandler:
         from core.substrate import substrate_service
 
         if data_by_call_hash := {
-            (multisig_event["call_hash"], multisig_event["multisig"]): multisig_event["approving"]
-            for multisig_event in block.event_data.get("Multisig", {}).get("MultisigExecuted", [])
+            (call_hash, multisig): approving
+            for call_hash, multisig, approving in map(
+                _get_multisig_approving, _events(block, "Multisig", "MultisigExecuted")
+            )
         }:
             extrinsic_data_by_call_hash = {}
-            for multisig_extrinsic in block.extrinsic_data.get("Multisig", {}).get("as_multi", []):
+            for multisig_extrinsic in _extrinsics(block, "Multisig", "as_multi"):
                 call = multisig_extrinsic["call"]
                 call_data = {
                     "module": call["call_module"],
@@ -588,21 +675,11 @@ class SubstrateEventHandler:
                 }
                 call_data["hash"] = substrate_service.create_multisig_transaction_call_hash(**call_data)
                 extrinsic_data_by_call_hash[call_data["hash"]] = call_data
+            executed_at = timezone.now()  # one timestamp for all Transactions executed in this Block
             for transaction in (
                 transaction_to_update := models.MultiSigTransaction.objects.filter(
-                    # WHERE (
-                    #     (call_hash = 1 AND multisig_id 2)
-                    #     OR (call_hash = 3 AND multisig_id 4)
-                    #     OR ...
-                    #     AND executed_at is null
-                    # )
-                    reduce(
-                        Q.__or__,
-                        [
-                            Q(call_hash=call_hash, multisig_id=multisig)
-                            for (call_hash, multisig) in data_by_call_hash.keys()
-                        ],
-                    ),
+                    # WHERE (call_hash, multisig_id) IN (('h1', 'acc1'), ('h2', 'acc2'), ...) AND executed_at IS NULL
+                    _rows_in(("call_hash", "multisig_id"), data_by_call_hash.keys()),
                     executed_at__isnull=True,
                 )
             ):
@@ -617,7 +694,7 @@ class SubstrateEventHandler:
 
                 transaction.approvers.append(data_by_call_hash[(transaction.call_hash, transaction.multisig_id)])
                 transaction.status = models.TransactionStatus.EXECUTED
-                transaction.executed_at = timezone.now()
+                transaction.executed_at = executed_at
 
             if transaction_to_update:
                 models.MultiSigTransaction.objects.bulk_update(
@@ -633,6 +710,7 @@ class SubstrateEventHandler:
                         "dao_id",
                         "proposal_id",
                     ),
+                    batch_size=settings.BULK_BATCH_SIZE,
                 )
 
     @staticmethod
@@ -644,33 +722,54 @@ class SubstrateEventHandler:
         cancels Transactions based on the Block's events
         """
         if data_by_call_hash := {
-            (multisig_event["call_hash"], multisig_event["multisig"]): multisig_event["cancelling"]
-            for multisig_event in block.event_data.get("Multisig", {}).get("MultisigCancelled", [])
+            (call_hash, multisig): cancelling
+            for call_hash, multisig, cancelling in map(
+                _get_multisig_cancelling, _events(block, "Multisig", "MultisigCancelled")
+            )
         }:
-            for transaction in (
-                transaction_to_update := models.MultiSigTransaction.objects.filter(
-                    # WHERE (
-                    #     (call_hash = 1 AND multisig_id 2)
-                    #     OR (call_hash = 3 AND multisig_id 4)
-                    #     OR ...
-                    #     AND executed_at is null
-                    # )
-                    reduce(
-                        Q.__or__,
-                        [
-                            Q(call_hash=call_hash, multisig_id=multisig)
-                            for (call_hash, multisig) in data_by_call_hash.keys()
-                        ],
-                    ),
-                    executed_at__isnull=True,
-                )
-            ):
-                transaction.canceled_by = data_by_call_hash[(transaction.call_hash, transaction.multisig_id)]
-                transaction.status = models.TransactionStatus.CANCELLED
-            if transaction_to_update:
-                models.MultiSigTransaction.objects.bulk_update(transaction_to_update, ("canceled_by", "status"))
+            call_keys_by_cancelling = defaultdict(list)  # {cancelling: [(call_hash, multisig_id), ...]}
+            for call_key, cancelling in data_by_call_hash.items():
+                call_keys_by_cancelling[cancelling].append(call_key)
+            # UPDATE multisig_transaction SET status = 'cancelled', canceled_by = CASE
+            #     WHEN (call_hash, multisig_id) IN (('h1', 'acc1'), ...) THEN 'acc2' ... END
+            # WHERE (call_hash, multisig_id) IN (('h1', 'acc1'), ('h2', 'acc3'), ...) AND executed_at IS NULL
+            models.MultiSigTransaction.objects.filter(
+                _rows_in(("call_hash", "multisig_id"), data_by_call_hash.keys()),
+                executed_at__isnull=True,
+            ).update(
+                status=models.TransactionStatus.CANCELLED,
+                canceled_by=Case(
+                    *[
+                        When(_rows_in(("call_hash", "multisig_id"), call_keys), then=Value(cancelling))
+                        for cancelling, call_keys in call_keys_by_cancelling.items()
+                    ]
+                ),
+            )
+
+    def _run_block_actions(self, block: models.Block):
+        """
+        Args:
+            block: Block to run the actions for
+
+        runs all block actions for the given Block
+
+        Raises:
+            ParseBlockException
+        """
+        # the traceback logged below points to the failing action
+        try:
+            for block_action, event_modules in self.block_actions:
+                if not block.event_data.keys().isdisjoint(event_modules):
+                    block_action(block=block)
+        except IntegrityError:
+            msg = f"Database error while parsing Block #{block.number}."
+            logger.exception(msg)
+            raise ParseBlockException(msg)
+        except Exception:  # noqa E722
+            msg = f"Unexpected error while parsing Block #{block.number}."
+            logger.exception(msg)
+            raise ParseBlockException(msg)
 
-    @atomic
     def execute_actions(self, block: models.Block):
         """
         Args:
@@ -678,21 +777,36 @@ class SubstrateEventHandler:
 
          alters db's blockchain representation based on the Block's extrinsics and events
         """
-        for block_action in self.block_actions:
-            try:
-                block_action(block=block)
-            except IntegrityError:
-                msg = f"Database error while parsing Block #{block.number}."
-                logger.exception(msg)
-                raise ParseBlockException(msg)
-            except Exception:  # noqa E722
-                msg = f"Unexpected error while parsing Block #{block.number}."
-                logger.exception(msg)
-                raise ParseBlockException(msg)
-
+        # Blocks w/o any relevant events are marked as executed right away, w/o opening a transaction
+        if block.event_data.keys().isdisjoint(self.event_modules):
+            models.Block.objects.filter(pk=block.pk).update(executed=True)
+        else:
+            with atomic():
+                self._run_block_actions(block=block)
+                models.Block.objects.filter(pk=block.pk).update(executed=True)
         block.executed = True
-        block.save(update_fields=["executed"])
         cache.set(key="current_block", value=(block.number, block.hash))
 
+    @atomic
+    def execute_actions_batch(self, blocks: Sequence[models.Block]):
+        """
+        Args:
+            blocks: Blocks to execute, ordered by number
+
+        alters db's blockchain representation based on the Blocks' extrinsics and events.
+        all Blocks are executed within a single transaction, either all or none of them are executed.
+        """
+        if not blocks:
+            return
+
+        for block in blocks:
+            self._run_block_actions(block=block)
+
+        models.Block.objects.filter(pk__in=[block.pk for block in blocks]).update(executed=True)
+        for block in blocks:
+            block.executed = True
+        # published after COMMIT, keeps the cache round trip out of the transaction
+        on_commit(partial(cache.set, key="current_block", value=(blocks[-1].number, blocks[-1].hash)))
+
 
 substrate_event_handler = SubstrateEventHandler()
@@ -21,13 +21,14 @@ class S3Client:
             "region_name": self.region_name,
         }
         self.client = boto3.client(**s3_credentials)
-        self.resource = boto3.resource(**s3_credentials)
 
     @staticmethod
     @shared_task(serializer="pickle")
     def _upload_file(**kwargs):
         try:
-            s3_client.client.upload_fileobj(**kwargs)
+            # single PUT request. uploaded files (logos, metadata.json) are far below the multipart threshold, so
+            # upload_fileobj's transfer manager / thread pool setup would be pure overhead
+            s3_client.client.put_object(**kwargs)
         except ClientError:
             logger.exception(f"Error while uploading a file to s3. {kwargs}")
 
@@ -42,9 +43,7 @@ class S3Client:
 
         uploads file to s3
         """
-        self._upload_file.delay(
-            Fileobj=file, Bucket=self.bucket_name, Key=storage_destination, ExtraArgs={"ACL": "public-read"}
-        )
+        self._upload_file.delay(Body=file, Bucket=self.bucket_name, Key=storage_destination, ACL="public-read")
         return f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{storage_destination}"
 
     def delete_file(self, storage_destination):
@@ -55,7 +54,14 @@ class S3Client:
         deletes file from s3
         """
         try:
-            self.resource.Bucket(self.bucket_name).objects.filter(Prefix=storage_destination).delete()
+            # list_objects_v2 pages hold up to 1000 keys, the max. number of keys per delete_objects call
+            for page in self.client.get_paginator("list_objects_v2").paginate(
+                Bucket=self.bucket_name, Prefix=storage_destination
+            ):
+                if objects := page.get("Contents"):
+                    self.client.delete_objects(
+                        Bucket=self.bucket_name, Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]}
+                    )
         except ClientError:
             logger.exception("Error while deleting a file from s3.")
 
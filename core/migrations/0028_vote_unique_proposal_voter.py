@@ -0,0 +1,16 @@
+# Generated by Django 4.1.7 on 2026-10-17 04:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0027_assetholding_vesting_wallet_assetholding_vote_escrow"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="vote",
+            unique_together={("proposal", "voter")},
+        ),
+    ]
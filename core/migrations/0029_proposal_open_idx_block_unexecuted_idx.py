@@ -0,0 +1,22 @@
+# Generated by Django 4.1.7 on 2026-10-17 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0028_vote_unique_proposal_voter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="block",
+            index=models.Index(condition=models.Q(("executed", False)), fields=["number"], name="block_unexecuted_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="proposal",
+            index=models.Index(
+                condition=models.Q(("status__in", ["running", "pending"])), fields=["status"], name="proposal_open_idx"
+            ),
+        ),
+    ]
@@ -17,7 +17,7 @@ from substrateinterface.keypair import Keypair
 from websocket import WebSocketConnectionClosedException
 
 from core import models
-from core.event_handler import substrate_event_handler
+from core.event_handler import ParseBlockException, substrate_event_handler
 from core.models import Dao
 
 logger = logging.getLogger("alerts")
@@ -316,6 +316,7 @@ class SubstrateService(object):
                 for acc_addr, _ in self.substrate_interface.query_map("System", "Account")
             ],
             ignore_conflicts=True,
+            batch_size=settings.BULK_BATCH_SIZE,
         )
 
     def create_dao(self, dao_id: str, dao_name: str, keypair: Keypair, wait_for_inclusion=False):
@@ -1052,12 +1053,21 @@ class SubstrateService(object):
                 substrate_event_handler.execute_actions(current_block)
                 last_block = current_block
             # our db is out of sync with the chain. we fetch and execute blocks until we caught up
+            # blocks are executed in batches of BLOCK_BATCH_SIZE, each within a single transaction
             else:
-                while current_block.number > last_block.number:
-                    logger.info(f"Catching up | number: {last_block.number + 1}")
-                    next_block = self.fetch_and_parse_block(block_number=last_block.number + 1)
-                    substrate_event_handler.execute_actions(next_block)
-                    last_block = next_block
+                blocks = []
+                for block_number in range(last_block.number + 1, current_block.number + 1):
+                    logger.info(f"Catching up | number: {block_number}")
+                    blocks.append(self.fetch_and_parse_block(block_number=block_number))
+                    if len(blocks) == settings.BLOCK_BATCH_SIZE or block_number == current_block.number:
+                        try:
+                            substrate_event_handler.execute_actions_batch(blocks)
+                        except ParseBlockException:
+                            # the batch was rolled back. execute its Blocks one by one to keep the ones preceding the
+                            # failing Block, which then is the first unexecuted Block for the retry on startup.
+                            for block in blocks:
+                                substrate_event_handler.execute_actions(block)
+                        last_block, blocks = blocks[-1], []
                     time.sleep(0.25)  # todo implement non shitty solution
 
             self.sleep(start_time=start_time)
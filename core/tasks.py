@@ -1,6 +1,7 @@
 import logging
 
 from celery import shared_task
+from django.conf import settings
 
 from core import models
 
@@ -38,7 +39,11 @@ def update_dao_metadata(dao_metadata: dict):
             logger.exception("Unexpected error while fetching DAO metadata from provided url.")
 
     if daos_to_update:
-        models.Dao.objects.bulk_update(daos_to_update, fields=["metadata", "metadata_url", "metadata_hash"])
+        models.Dao.objects.bulk_update(
+            daos_to_update,
+            fields=["metadata", "metadata_url", "metadata_hash"],
+            batch_size=settings.BULK_BATCH_SIZE,
+        )
 
 
 @shared_task()
@@ -72,4 +77,6 @@ def update_proposal_metadata(proposal_ids: list):
         else:
             proposal_to_update.append(proposal)
     if proposal_to_update:
-        models.Proposal.objects.bulk_update(proposal_to_update, fields=update_fields)
+        models.Proposal.objects.bulk_update(
+            proposal_to_update, fields=update_fields, batch_size=settings.BULK_BATCH_SIZE
+        )
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from botocore.exceptions import ClientError
 
@@ -12,49 +12,61 @@ class AWSTest(UnitTestCase):
         self.s3_client.bucket_name = "bucket1"
         self.s3_client.region_name = "region1"
         self.s3_client.client = Mock()
-        self.s3_client.resource = Mock()
         self.file = "file"
 
     def test_upload_file(self):
         res = self.s3_client.upload_file(file=self.file, storage_destination="store/here")
 
-        self.s3_client.client.upload_fileobj.assert_called_once_with(
-            Fileobj=self.file,
+        self.s3_client.client.put_object.assert_called_once_with(
+            Body=self.file,
             Bucket="bucket1",
             Key="store/here",
-            ExtraArgs={"ACL": "public-read"},
+            ACL="public-read",
         )
         self.assertEqual(res, "https://bucket1.s3.region1.amazonaws.com/store/here")
 
     @patch("core.file_handling.aws.logger")
     def test_upload_file_fail(self, logger_mock):
-        self.s3_client.client.upload_fileobj.side_effect = ClientError({"Error": {"Code": 123}}, "upload_fileobj")
+        self.s3_client.client.put_object.side_effect = ClientError({"Error": {"Code": 123}}, "put_object")
         kwargs = {
-            "Fileobj": self.file,
+            "Body": self.file,
             "Bucket": "bucket1",
             "Key": "store/here",
-            "ExtraArgs": {"ACL": "public-read"},
+            "ACL": "public-read",
         }
 
         res = self.s3_client.upload_file(file=self.file, storage_destination="store/here")
 
-        self.s3_client.client.upload_fileobj.assert_called_once_with(**kwargs)
+        self.s3_client.client.put_object.assert_called_once_with(**kwargs)
         self.assertEqual(res, "https://bucket1.s3.region1.amazonaws.com/store/here")
         logger_mock.exception.assert_called_once_with(f"Error while uploading a file to s3. {str(kwargs)}")
 
     def test_delete_file(self):
+        self.s3_client.client.get_paginator().paginate.return_value = [
+            {"Contents": [{"Key": "some_folder/file1"}, {"Key": "some_folder/file2"}]},
+            {"Contents": [{"Key": "some_folder/file3"}]},
+            {"KeyCount": 0},
+        ]
+
         self.s3_client.delete_file(storage_destination="some_folder/")
 
-        bucket = self.s3_client.resource.Bucket
-        bucket.assert_called_once_with("bucket1")
-        bucket().objects.filter.assert_called_once_with(Prefix="some_folder/")
-        bucket().objects.filter().delete.assert_called_once_with()
+        self.s3_client.client.get_paginator.assert_called_with("list_objects_v2")
+        self.s3_client.client.get_paginator().paginate.assert_called_once_with(Bucket="bucket1", Prefix="some_folder/")
+        self.assertListEqual(
+            self.s3_client.client.delete_objects.call_args_list,
+            [
+                call(
+                    Bucket="bucket1",
+                    Delete={"Objects": [{"Key": "some_folder/file1"}, {"Key": "some_folder/file2"}]},
+                ),
+                call(Bucket="bucket1", Delete={"Objects": [{"Key": "some_folder/file3"}]}),
+            ],
+        )
 
     @patch("core.file_handling.aws.logger")
     def test_delete_file_fail(self, logger_mock):
-        self.s3_client.resource.Bucket().objects.filter().delete.side_effect = ClientError(
-            {"Error": {"Code": 123}}, "delete"
-        )
+        self.s3_client.client.get_paginator().paginate.return_value = [{"Contents": [{"Key": "some_folder/file1"}]}]
+        self.s3_client.client.delete_objects.side_effect = ClientError({"Error": {"Code": 123}}, "delete_objects")
 
         self.s3_client.delete_file(storage_destination="some_folder/")
 
@@ -1,17 +1,20 @@
 import json
+import sys
 from io import BytesIO
-from unittest.mock import ANY, call, patch
+from unittest.mock import ANY, Mock, call, patch
 
 from ddt import data, ddt
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.test import override_settings
+from requests import HTTPError
 
 from core.file_handling.file_handler import (
+    DOWNLOAD_TIMEOUT,
     FileHandler,
     HashMismatchException,
     file_handler,
 )
-from core.tests.testcases import UnitTestCase
+from core.tests.testcases import UnitTestCase, http_response
 
 
 @ddt
@@ -22,6 +25,20 @@ class FileHandlerTest(UnitTestCase):
         ):
             FileHandler()
 
+    def test_blake3_encryption_algorithm(self):
+        blake3_module = Mock()
+
+        with override_settings(ENCRYPTION_ALGORITHM="blake3"), patch.dict(sys.modules, {"blake3": blake3_module}):
+            self.assertEqual(FileHandler().encryption_algorithm, blake3_module.blake3)
+
+    def test_blake3_encryption_algorithm_not_installed(self):
+        with override_settings(ENCRYPTION_ALGORITHM="blake3"), patch.dict(
+            sys.modules, {"blake3": None}
+        ), self.assertRaisesMessage(
+            Exception, "'blake3' encryption algorithm requires the blake3 package to be installed."
+        ):
+            FileHandler()
+
     def test_invalid_file_upload_class(self):
         with override_settings(FILE_UPLOAD_CLASS="non_existent"), self.assertRaisesMessage(
             Exception, "non_existent doesn't look like a module path"
@@ -83,32 +100,41 @@ class FileHandlerTest(UnitTestCase):
                     "some": "other",
                     "interesting": "data",
                 },
-                "metadata_hash": "491a300727047f4ac6d0ecf87629904292e8b38ae6e19c40947dabeffb78214a",  # noqa
+                "metadata_hash": "075b84e995a9de084cf9198b38d51619eb65d9f45854bc67e0e9cc2c22bde82f",  # noqa
                 "metadata_url": "https://some_storage.some_region.com/store/here/metadata.json",
             },
         )
         file.close()
 
-    @patch("core.file_handling.file_handler.urlopen")
-    def test_download_metadata(self, urlopen_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test_download_metadata(self, session_mock):
         expected_data = {"a": 1}
         file = BytesIO(json.dumps(expected_data).encode())
-        urlopen_mock.return_value = file
+        session_mock.get.return_value = http_response(file)
         metadata_hash = file_handler._hash(file.getvalue())
 
         res = file_handler.download_metadata(url="some_url", metadata_hash=metadata_hash)
 
-        urlopen_mock.assert_called_once_with("some_url")
+        session_mock.get.assert_called_once_with("some_url", stream=True, timeout=DOWNLOAD_TIMEOUT)
         self.assertDictEqual(res, expected_data)
 
-    @patch("core.file_handling.file_handler.urlopen")
-    def test_download_metadata_hash_mismatch(self, urlopen_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test_download_metadata_hash_mismatch(self, session_mock):
         expected_data = {"a": 1}
         file = BytesIO(json.dumps(expected_data).encode())
-        urlopen_mock.return_value = file
+        session_mock.get.return_value = http_response(file)
         metadata_hash = "not it"
 
         with self.assertRaises(HashMismatchException):
             self.assertIsNone(file_handler.download_metadata(url="some_url", metadata_hash=metadata_hash))
 
-        urlopen_mock.assert_called_once_with("some_url")
+        session_mock.get.assert_called_once_with("some_url", stream=True, timeout=DOWNLOAD_TIMEOUT)
+
+    @patch("core.file_handling.file_handler.session")
+    def test_download_metadata_http_error(self, session_mock):
+        session_mock.get.return_value = http_response(BytesIO(b"not found"), status_code=404)
+
+        with self.assertRaises(HTTPError):
+            file_handler.download_metadata(url="some_url", metadata_hash="some hash")
+
+        session_mock.get.assert_called_once_with("some_url", stream=True, timeout=DOWNLOAD_TIMEOUT)
@@ -15,8 +15,8 @@ from core.event_handler import (
     SubstrateEventHandler,
     substrate_event_handler,
 )
-from core.file_handling.file_handler import file_handler
-from core.tests.testcases import IntegrationTestCase
+from core.file_handling.file_handler import DOWNLOAD_TIMEOUT, file_handler
+from core.tests.testcases import IntegrationTestCase, http_response
 
 
 class EventHandlerTest(IntegrationTestCase):
@@ -33,17 +33,24 @@ class EventHandlerTest(IntegrationTestCase):
                         {"account": "acc2"},
                     ],
                 },
+                "DaoCore": {
+                    "DaoOwnerChanged": [
+                        {"new_owner": "acc2", "dao_id": "dao1", "not": "interesting"},
+                        {"new_owner": "acc3", "dao_id": "dao2", "not": "interesting"},
+                    ]
+                },
             },
         )
         expected_accs = [
             models.Account(address="acc1"),
             models.Account(address="acc2"),
+            models.Account(address="acc3"),
         ]
 
         with self.assertNumQueries(1):
             substrate_event_handler._create_accounts(block)
 
-        self.assertModelsEqual(models.Account.objects.all(), expected_accs)
+        self.assertModelsEqual(models.Account.objects.order_by("address"), expected_accs)
 
     def test__create_daos(self):
         models.Account.objects.create(address="acc1")
@@ -87,6 +94,7 @@ class EventHandlerTest(IntegrationTestCase):
         models.Account.objects.create(address="acc2")
         models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1", creator_id="acc1")
         models.Dao.objects.create(id="dao2", name="dao2 name", owner_id="acc2", creator_id="acc2")
+        models.Account.objects.create(address="acc4")
         models.Dao.objects.create(id="dao3", name="dao3 name", owner_id="acc2", creator_id="acc2")
         models.MultiSig.objects.create(address="acc3")
 
@@ -119,7 +127,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Account(address="acc4"),
         ]
 
-        with self.assertNumQueries(5):
+        with self.assertNumQueries(3):
             substrate_event_handler._transfer_dao_ownerships(block)
 
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
@@ -131,6 +139,8 @@ class EventHandlerTest(IntegrationTestCase):
     def test__transfer_dao_ownerships_no_multisigs(self):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
+        models.Account.objects.create(address="acc3")
+        models.Account.objects.create(address="acc4")
         models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1", creator_id="acc1")
         models.Dao.objects.create(id="dao2", name="dao2 name", owner_id="acc2", creator_id="acc2")
         models.Dao.objects.create(id="dao3", name="dao3 name", owner_id="acc2", creator_id="acc2")
@@ -164,7 +174,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Account(address="acc4"),
         ]
 
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(2):
             substrate_event_handler._transfer_dao_ownerships(block)
 
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
@@ -299,7 +309,7 @@ class EventHandlerTest(IntegrationTestCase):
             },
         )
 
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(1):
             substrate_event_handler._transfer_assets(block)
 
         expected_asset_holdings = [
@@ -319,6 +329,30 @@ class EventHandlerTest(IntegrationTestCase):
             ignore_fields=("id", "created_at", "updated_at"),
         )
 
+    def test__transfer_assets_missing_holding(self):
+        models.Account.objects.create(address="acc1")
+        models.Account.objects.create(address="acc2")
+        models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1")
+        models.Asset.objects.create(id=1, total_supply=150, owner_id="acc1", dao_id="dao1")
+        models.AssetHolding.objects.create(asset_id=1, owner_id="acc1", balance=100)
+        block = models.Block.objects.create(
+            hash="hash 0",
+            number=0,
+            event_data={
+                "Assets": {
+                    "Transferred": [
+                        {"asset_id": 1, "amount": 10, "from": "acc1", "to": "acc2"},
+                        {"asset_id": 1, "amount": 15, "from": "acc2", "to": "acc1"},
+                    ],
+                },
+            },
+        )
+
+        with self.assertRaisesMessage(
+            ParseBlockException, "Transfers from Accounts without AssetHolding: [(1, 'acc2')]."
+        ), self.assertNumQueries(1):
+            substrate_event_handler._transfer_assets(block)
+
     def test__delegate_assets(self):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
@@ -346,7 +380,7 @@ class EventHandlerTest(IntegrationTestCase):
             },
         )
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             substrate_event_handler._delegate_assets(block)
 
         expected_asset_holdings = [
@@ -405,8 +439,8 @@ class EventHandlerTest(IntegrationTestCase):
             ignore_fields=("id", "created_at", "updated_at"),
         )
 
-    @patch("core.file_handling.file_handler.urlopen")
-    def test__set_dao_metadata(self, urlopen_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test__set_dao_metadata(self, session_mock):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
         models.Account.objects.create(address="acc3")
@@ -420,7 +454,8 @@ class EventHandlerTest(IntegrationTestCase):
         file_2 = BytesIO(json.dumps(metadata_2).encode())
         metadata_hash_2 = file_handler._hash(file_2.getvalue())
 
-        urlopen_mock.side_effect = lambda url: {"url1": file_1, "url2": file_2}.get(url)
+        responses = {"url1": http_response(file_1), "url2": http_response(file_2)}
+        session_mock.get.side_effect = lambda url, **_: responses.get(url)
         block = models.Block.objects.create(
             hash="hash 0",
             number=0,
@@ -467,15 +502,21 @@ class EventHandlerTest(IntegrationTestCase):
             models.Dao(id="dao3", name="dao3 name", owner_id="acc3", metadata_hash=None, metadata_url=None),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_dao_metadata(block)
 
-        urlopen_mock.assert_has_calls([call("url1"), call("url2")], any_order=True)
+        session_mock.get.assert_has_calls(
+            [
+                call("url1", stream=True, timeout=DOWNLOAD_TIMEOUT),
+                call("url2", stream=True, timeout=DOWNLOAD_TIMEOUT),
+            ],
+            any_order=True,
+        )
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
 
-    @patch("core.file_handling.file_handler.urlopen")
+    @patch("core.file_handling.file_handler.session")
     @patch("core.tasks.logger")
-    def test__set_dao_metadata_hash_mismatch(self, logger_mock, urlopen_mock):
+    def test__set_dao_metadata_hash_mismatch(self, logger_mock, session_mock):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
         models.Account.objects.create(address="acc3")
@@ -488,7 +529,8 @@ class EventHandlerTest(IntegrationTestCase):
         metadata_2 = {"a": 2}
         file_2 = BytesIO(json.dumps(metadata_2).encode())
 
-        urlopen_mock.side_effect = lambda url: {"url1": file_1, "url2": file_2}.get(url)
+        responses = {"url1": http_response(file_1), "url2": http_response(file_2)}
+        session_mock.get.side_effect = lambda url, **_: responses.get(url)
 
         block = models.Block.objects.create(
             hash="hash 0",
@@ -529,10 +571,16 @@ class EventHandlerTest(IntegrationTestCase):
             models.Dao(id="dao3", name="dao3 name", owner_id="acc3"),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_dao_metadata(block)
 
-        urlopen_mock.assert_has_calls([call("url1"), call("url2")], any_order=True)
+        session_mock.get.assert_has_calls(
+            [
+                call("url1", stream=True, timeout=DOWNLOAD_TIMEOUT),
+                call("url2", stream=True, timeout=DOWNLOAD_TIMEOUT),
+            ],
+            any_order=True,
+        )
         logger_mock.error.assert_called_once_with("Hash mismatch while fetching DAO metadata from provided url.")
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
 
@@ -603,7 +651,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Dao(id="dao3", name="dao3 name", owner_id="acc3"),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_dao_metadata(block)
 
         download_metadata_mock.assert_has_calls(
@@ -616,8 +664,8 @@ class EventHandlerTest(IntegrationTestCase):
         logger_mock.exception.assert_called_once_with("Unexpected error while fetching DAO metadata from provided url.")
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
 
-    @patch("core.file_handling.file_handler.urlopen")
-    def test__set_dao_metadata_nothing_to_update(self, urlopen_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test__set_dao_metadata_nothing_to_update(self, session_mock):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
         models.Account.objects.create(address="acc3")
@@ -657,10 +705,10 @@ class EventHandlerTest(IntegrationTestCase):
             models.Dao(id="dao3", name="dao3 name", owner_id="acc3"),
         ]
 
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_dao_metadata(block)
 
-        urlopen_mock.assert_not_called()
+        session_mock.get.assert_not_called()
         self.assertModelsEqual(models.Dao.objects.order_by("id"), expected_daos)
 
     def test__dao_set_governance(self):
@@ -670,6 +718,14 @@ class EventHandlerTest(IntegrationTestCase):
         models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1")
         models.Dao.objects.create(id="dao2", name="dao2 name", owner_id="acc2")
         models.Dao.objects.create(id="dao3", name="dao3 name", owner_id="acc3")
+        # should be replaced
+        models.Governance.objects.create(
+            dao_id="dao1",
+            proposal_duration=10,
+            proposal_token_deposit=20,
+            minimum_majority=30,
+            type=models.GovernanceType.MAJORITY_VOTE,
+        )
 
         block = models.Block.objects.create(
             hash="hash 0",
@@ -714,7 +770,7 @@ class EventHandlerTest(IntegrationTestCase):
             ),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             substrate_event_handler._dao_set_governances(block)
 
         created_governances = models.Governance.objects.order_by("dao_id")
@@ -808,7 +864,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Vote(proposal_id=2, voter_id="acc2", voting_power=30, in_favor=None),
         ]
 
-        with self.assertNumQueries(3), freeze_time(time):
+        with self.assertNumQueries(2), freeze_time(time):
             substrate_event_handler._create_proposals(block)
 
         self.assertModelsEqual(models.Proposal.objects.order_by("id"), expected_proposals)
@@ -818,8 +874,8 @@ class EventHandlerTest(IntegrationTestCase):
             ignore_fields=("created_at", "updated_at", "id"),
         )
 
-    @patch("core.file_handling.file_handler.urlopen")
-    def test__set_proposal_metadata(self, urlopen_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test__set_proposal_metadata(self, session_mock):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
         models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1")
@@ -833,7 +889,8 @@ class EventHandlerTest(IntegrationTestCase):
         file_2 = BytesIO(json.dumps(metadata_2).encode())
         metadata_hash_2 = file_handler._hash(file_2.getvalue())
 
-        urlopen_mock.side_effect = lambda url: {"url1": file_1, "url2": file_2}.get(url)
+        responses = {"url1": http_response(file_1), "url2": http_response(file_2)}
+        session_mock.get.side_effect = lambda url, **_: responses.get(url)
         block = models.Block.objects.create(
             hash="hash 0",
             number=0,
@@ -899,15 +956,21 @@ class EventHandlerTest(IntegrationTestCase):
                 title=None,
             ),
         ]
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(4), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_proposal_metadata(block)
 
-        urlopen_mock.assert_has_calls([call("url1"), call("url2")], any_order=True)
+        session_mock.get.assert_has_calls(
+            [
+                call("url1", stream=True, timeout=DOWNLOAD_TIMEOUT),
+                call("url2", stream=True, timeout=DOWNLOAD_TIMEOUT),
+            ],
+            any_order=True,
+        )
         self.assertModelsEqual(models.Proposal.objects.order_by("id"), expected_proposals)
 
     @patch("core.tasks.logger")
-    @patch("core.file_handling.file_handler.urlopen")
-    def test__proposal_set_metadata_hash_mismatch(self, urlopen_mock, logger_mock):
+    @patch("core.file_handling.file_handler.session")
+    def test__proposal_set_metadata_hash_mismatch(self, session_mock, logger_mock):
         models.Account.objects.create(address="acc1")
         models.Account.objects.create(address="acc2")
         models.Account.objects.create(address="acc3")
@@ -923,7 +986,8 @@ class EventHandlerTest(IntegrationTestCase):
         file_2 = BytesIO(json.dumps(metadata_2).encode())
         metadata_hash_2 = file_handler._hash(file_2.getvalue())
 
-        urlopen_mock.side_effect = lambda url: {"url1": file_1, "url2": file_2}.get(url)
+        responses = {"url1": http_response(file_1), "url2": http_response(file_2)}
+        session_mock.get.side_effect = lambda url, **_: responses.get(url)
         block = models.Block.objects.create(
             hash="hash 0",
             number=0,
@@ -995,10 +1059,16 @@ class EventHandlerTest(IntegrationTestCase):
             ),
         ]
 
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(4), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_proposal_metadata(block)
 
-        urlopen_mock.assert_has_calls([call("url1"), call("url2")], any_order=True)
+        session_mock.get.assert_has_calls(
+            [
+                call("url1", stream=True, timeout=DOWNLOAD_TIMEOUT),
+                call("url2", stream=True, timeout=DOWNLOAD_TIMEOUT),
+            ],
+            any_order=True,
+        )
         logger_mock.error.assert_called_once_with("Hash mismatch while fetching Proposal metadata from provided url.")
 
         self.assertModelsEqual(models.Proposal.objects.order_by("id"), expected_proposals)
@@ -1082,7 +1152,7 @@ class EventHandlerTest(IntegrationTestCase):
             ),
         ]
 
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(4), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_proposal_metadata(block)
 
         download_metadata_mock.assert_has_calls(
@@ -1171,7 +1241,7 @@ class EventHandlerTest(IntegrationTestCase):
             ),
         ]
 
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(3), self.captureOnCommitCallbacks(execute=True):
             substrate_event_handler._set_proposal_metadata(block)
 
         download_metadata_mock.assert_has_calls(
@@ -1230,7 +1300,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Vote(proposal_id=2, voter_id="acc3", voting_power=50, in_favor=None),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             substrate_event_handler._register_votes(block)
 
         self.assertModelsEqual(
@@ -1332,7 +1402,7 @@ class EventHandlerTest(IntegrationTestCase):
             models.Proposal(id=5, dao_id="dao2", status=models.ProposalStatus.RUNNING, birth_block_number=10),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             substrate_event_handler._fault_proposals(block)
 
         self.assertModelsEqual(models.Proposal.objects.order_by("id"), expected_proposals)
@@ -1863,7 +1933,7 @@ class EventHandlerTest(IntegrationTestCase):
             ),
         ]
 
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             substrate_event_handler._cancel_transactions(block=block)
 
         self.assertModelsEqual(models.MultiSig.objects.order_by("address"), [multisig, multisig2])
@@ -1922,16 +1992,26 @@ class EventHandlerTest(IntegrationTestCase):
             ignore_fields=("id", "created_at", "updated_at"),
         )
 
-    @patch("core.event_handler.SubstrateEventHandler._instantiate_contracts")
-    @patch("core.event_handler.SubstrateEventHandler._create_accounts")
     @patch("core.event_handler.SubstrateEventHandler._create_daos")
     @patch("core.event_handler.SubstrateEventHandler._transfer_dao_ownerships")
     @patch("core.event_handler.SubstrateEventHandler._delete_daos")
+    @patch("core.event_handler.SubstrateEventHandler._set_dao_metadata")
+    def test__process_dao_core(self, *mocks):
+        block = models.Block(hash="hash 0", number=0, event_data={"DaoCore": {"DaoCreated": [{}]}})
+
+        with self.assertNumQueries(0):
+            substrate_event_handler._process_dao_core(block)
+
+        for mock in mocks:
+            mock.assert_called_once_with(block=block)
+
+    @patch("core.event_handler.SubstrateEventHandler._instantiate_contracts")
+    @patch("core.event_handler.SubstrateEventHandler._create_accounts")
+    @patch("core.event_handler.SubstrateEventHandler._process_dao_core")
     @patch("core.event_handler.SubstrateEventHandler._create_assets")
     @patch("core.event_handler.SubstrateEventHandler._transfer_assets")
     @patch("core.event_handler.SubstrateEventHandler._delegate_assets")
     @patch("core.event_handler.SubstrateEventHandler._revoke_asset_delegations")
-    @patch("core.event_handler.SubstrateEventHandler._set_dao_metadata")
     @patch("core.event_handler.SubstrateEventHandler._dao_set_governances")
     @patch("core.event_handler.SubstrateEventHandler._create_proposals")
     @patch("core.event_handler.SubstrateEventHandler._register_votes")
@@ -1943,7 +2023,18 @@ class EventHandlerTest(IntegrationTestCase):
     @patch("core.event_handler.SubstrateEventHandler._cancel_transactions")
     def test_execute_actions(self, *mocks):
         event_handler = SubstrateEventHandler()
-        block = models.Block.objects.create(hash="hash 0", number=0)
+        block = models.Block.objects.create(
+            hash="hash 0",
+            number=0,
+            event_data={
+                "Contracts": {},
+                "System": {},
+                "DaoCore": {},
+                "Assets": {},
+                "Votes": {},
+                "Multisig": {},
+            },
+        )
 
         with self.assertNumQueries(3):
             event_handler.execute_actions(block)
@@ -1957,11 +2048,127 @@ class EventHandlerTest(IntegrationTestCase):
         self.assertEqual(block_number, 0)
         self.assertEqual(block_hash, "hash 0")
 
+    @patch("core.event_handler.SubstrateEventHandler._transfer_assets")
+    @patch("core.event_handler.SubstrateEventHandler._register_votes")
+    def test_execute_actions_batch(self, register_votes_mock, transfer_assets_mock):
+        event_handler = SubstrateEventHandler()
+        block_0 = models.Block.objects.create(hash="hash 0", number=0, event_data={"Assets": {}})
+        block_1 = models.Block.objects.create(hash="hash 1", number=1, event_data={"Votes": {}})
+
+        with self.assertNumQueries(3), self.captureOnCommitCallbacks(execute=True):
+            event_handler.execute_actions_batch([block_0, block_1])
+
+        self.assertModelsEqual(
+            models.Block.objects.order_by("number"),
+            [
+                models.Block(hash="hash 0", number=0, event_data={"Assets": {}}, executed=True),
+                models.Block(hash="hash 1", number=1, event_data={"Votes": {}}, executed=True),
+            ],
+            ignore_fields=("created_at", "updated_at"),
+        )
+        self.assertTrue(block_0.executed)
+        self.assertTrue(block_1.executed)
+        transfer_assets_mock.assert_called_once_with(block=block_0)
+        register_votes_mock.assert_called_once_with(block=block_1)
+        self.assertEqual(cache.get("current_block"), (1, "hash 1"))
+
+    @patch("core.event_handler.logger")
+    @patch("core.event_handler.SubstrateEventHandler._register_votes")
+    def test_execute_actions_batch_error(self, action_mock, logger_mock):
+        event_handler = SubstrateEventHandler()
+        block_0 = models.Block.objects.create(hash="hash 0", number=0)
+        block_1 = models.Block.objects.create(hash="hash 1", number=1, event_data={"Votes": {}})
+        action_mock.side_effect = Exception
+
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(ParseBlockException):
+            event_handler.execute_actions_batch([block_0, block_1])
+
+        self.assertFalse(models.Block.objects.filter(executed=True).exists())
+        self.assertIsNone(cache.get("current_block"))
+        logger_mock.exception.assert_called_once_with("Unexpected error while parsing Block #1.")
+
+    @patch("core.tasks.update_dao_metadata.delay")
+    @patch("core.event_handler.SubstrateEventHandler._register_votes")
+    def test_execute_actions_no_tasks_for_rolled_back_block(self, action_mock, update_dao_metadata_mock):
+        models.Account.objects.create(address="acc1")
+        models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1")
+        block = models.Block.objects.create(
+            hash="hash 0",
+            number=0,
+            extrinsic_data={"DaoCore": {"set_metadata": [{"dao_id": "dao1", "meta": "url1", "hash": "hash1"}]}},
+            event_data={"DaoCore": {"DaoMetadataSet": [{"dao_id": "dao1"}]}, "Votes": {}},
+        )
+        action_mock.side_effect = Exception
+
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(ParseBlockException):
+            SubstrateEventHandler().execute_actions(block)
+
+        update_dao_metadata_mock.assert_not_called()
+
+    @patch("core.event_handler.SubstrateEventHandler._run_block_actions")
+    def test_execute_actions_no_relevant_events(self, run_block_actions_mock):
+        event_handler = SubstrateEventHandler()
+        block = models.Block.objects.create(hash="hash 0", number=0, event_data={"not": "interesting"})
+
+        with self.assertNumQueries(1):
+            event_handler.execute_actions(block)
+
+        block.refresh_from_db()
+        self.assertTrue(block.executed)
+        run_block_actions_mock.assert_not_called()
+        self.assertEqual(cache.get("current_block"), (0, "hash 0"))
+
+    def test_execute_actions_reads_own_writes(self):
+        # Assets issued within a Block can be transferred within the same Block, so the actions' writes must not be
+        # deferred until the end of the Block.
+        models.Account.objects.create(address="acc1")
+        models.Account.objects.create(address="acc2")
+        models.Dao.objects.create(id="dao1", name="dao1 name", owner_id="acc1")
+        block = models.Block.objects.create(
+            hash="hash 0",
+            number=0,
+            event_data={
+                "Assets": {
+                    "MetadataSet": [{"asset_id": 1, "symbol": "dao1"}],
+                    "Issued": [{"asset_id": 1, "owner": "acc1", "total_supply": 100}],
+                    "Transferred": [{"asset_id": 1, "amount": 30, "from": "acc1", "to": "acc2"}],
+                },
+            },
+        )
+        expected_asset_holdings = [
+            models.AssetHolding(asset_id=1, owner_id="acc1", balance=70),
+            models.AssetHolding(asset_id=1, owner_id="acc2", balance=30),
+        ]
+
+        SubstrateEventHandler().execute_actions(block)
+
+        self.assertModelsEqual(
+            models.AssetHolding.objects.order_by("owner_id"),
+            expected_asset_holdings,
+            ignore_fields=("id", "created_at", "updated_at"),
+        )
+
+    @patch("core.event_handler.SubstrateEventHandler._process_dao_core")
+    @patch("core.event_handler.SubstrateEventHandler._transfer_assets")
+    @patch("core.event_handler.SubstrateEventHandler._register_votes")
+    def test_execute_actions_skips_actions_wo_events(self, register_votes_mock, transfer_assets_mock, dao_core_mock):
+        event_handler = SubstrateEventHandler()
+        block = models.Block.objects.create(hash="hash 0", number=0, event_data={"DaoCore": {}})
+
+        with self.assertNumQueries(3):
+            event_handler.execute_actions(block)
+
+        block.refresh_from_db()
+        self.assertTrue(block.executed)
+        dao_core_mock.assert_called_once_with(block=block)
+        transfer_assets_mock.assert_not_called()
+        register_votes_mock.assert_not_called()
+
     @patch("core.event_handler.logger")
     @patch("core.event_handler.SubstrateEventHandler._transfer_assets")
     def test_execute_actions_db_error(self, action_mock, logger_mock):
         event_handler = SubstrateEventHandler()
-        block = models.Block.objects.create(hash="hash 0", number=0)
+        block = models.Block.objects.create(hash="hash 0", number=0, event_data={"Assets": {}})
         action_mock.side_effect = IntegrityError
 
         with self.assertNumQueries(3), self.assertRaises(ParseBlockException):
@@ -1976,7 +2183,7 @@ class EventHandlerTest(IntegrationTestCase):
     @patch("core.event_handler.SubstrateEventHandler._dao_set_governances")
     def test_execute_actions_expected_error(self, action_mock, logger_mock):
         event_handler = SubstrateEventHandler()
-        block = models.Block.objects.create(hash="hash 0", number=0)
+        block = models.Block.objects.create(hash="hash 0", number=0, event_data={"Votes": {}})
         action_mock.side_effect = Exception
 
         with self.assertNumQueries(3), self.assertRaises(ParseBlockException):
@@ -10,6 +10,7 @@ from substrateinterface.keypair import Keypair
 from websocket import WebSocketConnectionClosedException
 
 from core import models
+from core.event_handler import ParseBlockException
 from core.substrate import (
     OutOfSyncException,
     SubstrateException,
@@ -902,7 +903,69 @@ class SubstrateServiceTest(IntegrationTestCase):
             models.Block(number=3, hash="hash 3", parent_hash="hash 2", executed=True),
             models.Block(number=4, hash="hash 4", parent_hash="hash 3", executed=True),
         ]
-        self.assertModelsEqual(models.Block.objects.all(), expected_blocks)
+        self.assertModelsEqual(models.Block.objects.order_by("number"), expected_blocks)
+
+    @patch("core.substrate.substrate_event_handler.execute_actions_batch")
+    @patch("core.substrate.time.sleep")
+    @patch("core.substrate.slack_logger")
+    @patch("core.substrate.logger")
+    def test_listen_catching_up_batches(self, logger_mock, slack_logger_mock, sleep_mock, execute_actions_batch_mock):
+        sleep_mock.side_effect = None, None, None, Exception("break retry")  # 3 sleeps while catching up + 1 in retry
+        models.Block.objects.create(number=0, hash="hash 0", parent_hash=None, executed=True)
+        self.si.get_block.side_effect = (
+            {"header": {"number": 3, "hash": "hash 3", "parentHash": "hash 2"}, "extrinsics": []},
+            {"header": {"number": 1, "hash": "hash 1", "parentHash": "hash 0"}, "extrinsics": []},
+            {"header": {"number": 2, "hash": "hash 2", "parentHash": "hash 1"}, "extrinsics": []},
+            Exception("break"),
+        )
+        self.si.get_events.return_value = []
+
+        with override_settings(BLOCK_CREATION_INTERVAL=0, BLOCK_BATCH_SIZE=2), self.assertRaisesMessage(
+            Exception, "break"
+        ):
+            self.substrate_service.listen()
+
+        self.assertListEqual(
+            [[block.number for block in blocks] for (blocks,), _ in execute_actions_batch_mock.call_args_list],
+            [[1, 2], [3]],
+        )
+
+    @patch("core.substrate.time.sleep")
+    @patch("core.substrate.slack_logger")
+    @patch("core.substrate.logger")
+    def test_listen_catching_up_batches_failing_block(self, logger_mock, slack_logger_mock, sleep_mock):
+        models.Block.objects.create(number=0, hash="hash 0", parent_hash=None, executed=True)
+        self.si.get_block.side_effect = (
+            {"header": {"number": 3, "hash": "hash 3", "parentHash": "hash 2"}, "extrinsics": []},
+            {"header": {"number": 1, "hash": "hash 1", "parentHash": "hash 0"}, "extrinsics": []},
+            {"header": {"number": 2, "hash": "hash 2", "parentHash": "hash 1"}, "extrinsics": []},
+            {"header": {"number": 3, "hash": "hash 3", "parentHash": "hash 2"}, "extrinsics": []},
+        )
+        # Block 3 transfers from an Account without AssetHolding
+        transfer = Mock(
+            value={
+                "module_id": "Assets",
+                "event_id": "Transferred",
+                "attributes": {"asset_id": 1, "amount": 10, "from": "acc1", "to": "acc2"},
+            },
+            value_object={},
+        )
+        self.si.get_events.side_effect = lambda block_hash: [transfer] if block_hash == "hash 3" else []
+
+        with override_settings(BLOCK_CREATION_INTERVAL=0, BLOCK_BATCH_SIZE=3), self.assertRaises(ParseBlockException):
+            self.substrate_service.listen()
+
+        expected_blocks = [
+            models.Block(number=0, hash="hash 0", parent_hash=None, executed=True),
+            models.Block(number=1, hash="hash 1", parent_hash="hash 0", executed=True),
+            models.Block(number=2, hash="hash 2", parent_hash="hash 1", executed=True),
+            models.Block(number=3, hash="hash 3", parent_hash="hash 2", executed=False),
+        ]
+        self.assertModelsEqual(
+            models.Block.objects.order_by("number"),
+            expected_blocks,
+            ignore_fields=("created_at", "updated_at", "event_data", "extrinsic_data"),
+        )
 
     @patch("core.substrate.time.sleep")
     @patch("core.substrate.slack_logger")
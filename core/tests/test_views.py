@@ -198,7 +198,7 @@ class CoreViewSetTest(IntegrationTestCase):
         self.assertDictEqual(res.json(), expected_res)
 
     def test_dao_get(self):
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(1):
             res = self.client.get(reverse("core-dao-detail", kwargs={"pk": "dao1"}))
 
         self.assertDictEqual(res.json(), expected_dao1_res)
@@ -206,7 +206,7 @@ class CoreViewSetTest(IntegrationTestCase):
     def test_dao_get_list(self):
         expected_res = wrap_in_pagination_res([expected_dao1_res, expected_dao2_res])
 
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(2):
             res = self.client.get(reverse("core-dao-list"))
 
         self.assertDictEqual(res.json(), expected_res)
@@ -221,7 +221,7 @@ class CoreViewSetTest(IntegrationTestCase):
     def test_dao_list_filter(self, query_params):
         expected_res = wrap_in_pagination_res([expected_dao2_res])
 
-        with self.assertNumQueries(5):
+        with self.assertNumQueries(2):
             res = self.client.get(reverse("core-dao-list"), query_params)
 
         self.assertEqual(res.status_code, HTTP_200_OK)
@@ -320,7 +320,7 @@ class CoreViewSetTest(IntegrationTestCase):
 
         expected_res = wrap_in_pagination_res(expected_res)
 
-        with self.assertNumQueries(10):
+        with self.assertNumQueries(2):
             res = self.client.get(reverse("core-dao-list"), query_params)
 
         self.assertDictEqual(res.json(), expected_res)
@@ -375,7 +375,7 @@ class CoreViewSetTest(IntegrationTestCase):
                 },
                 expected_dao1_res,
             ],
-            16,
+            4,
         ),
         (
             {"prioritise_holder": "acc3", "ordering": "-name"},
@@ -425,7 +425,7 @@ class CoreViewSetTest(IntegrationTestCase):
                 expected_dao1_res,
                 expected_dao2_res,
             ],
-            16,
+            4,
         ),
         (
             {"prioritise_owner": "acc2", "prioritise_holder": "acc3", "ordering": "name"},
@@ -475,7 +475,7 @@ class CoreViewSetTest(IntegrationTestCase):
                     "ink_vote_escrow_contract": None,
                 },
             ],
-            17,
+            5,
         ),
     )
     def test_dao_list_prioritised(self, case):
@@ -498,7 +498,7 @@ class CoreViewSetTest(IntegrationTestCase):
     def test_dao_list_no_limit(self):
         expected_res = [expected_dao1_res, expected_dao2_res]
 
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(2):
             res = self.client.get(reverse("core-dao-list"), {"prioritise_owner": "acc2"})
 
         self.assertCountEqual(res.json(), expected_res)
@@ -537,7 +537,7 @@ class CoreViewSetTest(IntegrationTestCase):
                     }
                 },
             },
-            "metadata_hash": "a1a0591662255e72aba330746eee9a50815d4580efaf3e60aa687c7ac12d473d",
+            "metadata_hash": "8785dc74a42b2eb9d84780040aed610d441a4befe5db92b849847c964170da74",
             "metadata_url": "https://some_storage.some_region.com/DAO1/metadata.json",
         }
 
@@ -582,7 +582,7 @@ class CoreViewSetTest(IntegrationTestCase):
                     }
                 },
             },
-            "metadata_hash": "a1a0591662255e72aba330746eee9a50815d4580efaf3e60aa687c7ac12d473d",
+            "metadata_hash": "8785dc74a42b2eb9d84780040aed610d441a4befe5db92b849847c964170da74",
             "metadata_url": "https://some_storage.some_region.com/DAO1/metadata.json",
         }
 
@@ -624,7 +624,7 @@ class CoreViewSetTest(IntegrationTestCase):
                     }
                 },
             },
-            "metadata_hash": "a1a0591662255e72aba330746eee9a50815d4580efaf3e60aa687c7ac12d473d",
+            "metadata_hash": "8785dc74a42b2eb9d84780040aed610d441a4befe5db92b849847c964170da74",
             "metadata_url": "https://some_storage.some_region.com/DAO1/metadata.json",
         }
 
@@ -852,7 +852,7 @@ class CoreViewSetTest(IntegrationTestCase):
         }
         expected_res = {
             "metadata": post_data,
-            "metadata_hash": "d22aaac3a17b4510ef9bd8ed67188bb6fbb29a75347aed1d23b6dcf3cf6e6c7b",
+            "metadata_hash": "98f42b9ff7684b6b935887ced41e51bd1965e8a4da3ae6a8e46ca74e36b49a4a",
             "metadata_url": "https://some_storage.some_region.com/dao1/proposals/3/metadata.json",
         }
 
@@ -1,12 +1,28 @@
 from collections.abc import Collection, Iterable
-from typing import Sequence
+from typing import BinaryIO, Sequence
 from unittest.mock import Mock
 
+import requests
 from django import test
 from django.core.cache import cache
 from django.db.models import Model
 
 
+def http_response(raw: BinaryIO, status_code: int = 200) -> requests.Response:
+    """
+    Args:
+        raw: file-like response body
+        status_code: HTTP status code
+
+    Returns:
+        requests.Response, e.g. as return value of a mocked requests.Session.get
+    """
+    response = requests.Response()
+    response.raw = raw
+    response.status_code = status_code
+    return response
+
+
 class TestCaseBase(test.SimpleTestCase):
     def tearDown(self):  # noqa
         cache.clear()
@@ -125,7 +125,7 @@ class DaoViewSet(ReadOnlyModelViewSet, SearchableMixin):
     pagination_class = MultiQsLimitOffsetPagination
 
     def get_queryset(self):
-        return self.queryset.select_related("asset", "governance")
+        return self.queryset.select_related("asset", "governance").with_stats()
 
     def get_serializer_class(self):
         return {
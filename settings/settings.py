@@ -209,6 +209,8 @@ SUBSTRATE_FUNDING_KEYPAIR_URI = os.environ.get("SUBSTRATE_FUNDING_KEYPAIR_URI",
 SS58_FORMAT = 42
 BLOCK_CREATION_INTERVAL = int(os.environ.get("BLOCK_CREATION_INTERVAL", 6))  # seconds
 RETRY_DELAYS = [int(_) for _ in os.environ.get("RETRY_DELAYS", "5,10,30,60,120").split(",")]
+BULK_BATCH_SIZE = int(os.environ.get("BULK_BATCH_SIZE", 1000))  # max. rows per bulk_create / bulk_update query
+BLOCK_BATCH_SIZE = int(os.environ.get("BLOCK_BATCH_SIZE", 100))  # max. blocks executed per transaction when catching up
 DEPOSIT_TO_CREATE_DAO = 10_000_000_000_000
 DEPOSIT_TO_CREATE_PROPOSAL = 1_000_000_000_000
 TYPE_REGISTRY_PRESET = "polkadot"